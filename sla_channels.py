@@ -0,0 +1,71 @@
+# --- Channel specs: everything that differs between the dashboards lives here.
+# The pipeline (sla_pipeline) and the UI (sla_dashboard) read these and nothing else.
+#
+# durations    measure prefix -> source column holding HH:MM:SS / MM:SS text
+# volume       column summed as the channel's volume (chats, calls)
+# abandoned    {'column', 'pattern'} flags rows whose column matches the pattern;
+#              {'column'} alone sums that column as an abandoned count
+# service_level column holding "NN%" text, or None
+# extra_dims   extra cube dimensions, each with its own sidebar filter
+CHANNELS = {
+    'chat': {
+        'title': "📊 SLA Chat Hourly Dashboard",
+        'dirs': {
+            'Current': "Filtered/SLA_Chat Hourly",
+            'Before': "Filtered_before/SLA_Chat Hourly",
+        },
+        'natural_key': ['DATE', 'HOUR', 'SKILL', 'CAMPAIGN', 'DISPOSITION'],
+        'extra_dims': {'CAMPAIGN': "Campaign"},
+        'durations': {
+            'QUEUE': 'CHAT QUEUE TIME',
+            'HANDLE': 'HANDLE TIME',
+            'ACW': 'AFTER CHAT WORK',
+        },
+        'volume': 'INTERACTIONS',
+        'abandoned': {'column': 'DISPOSITION', 'pattern': 'Unresolved|Unresponsive'},
+        'service_level': None,
+        'unit': "Chat",
+        'icon': "💬",
+        'hourly_y_max': 30000,
+    },
+    'voice': {
+        'title': "📞 SLA Voice Hourly Dashboard",
+        'dirs': {
+            'Current': "Filtered/VOICE_Hourly_SLA",
+            'Before': "Filtered_before/SLA_VOICE HOURLY (New Pod Skills)",
+        },
+        'natural_key': ['DATE', 'HOUR', 'SKILL'],
+        'extra_dims': {},
+        'durations': {
+            'QUEUE': 'Average QUEUE WAIT TIME',
+            'HANDLE': 'Average HANDLE TIME',
+            'ACW': 'Average AFTER CALL WORK TIME',
+        },
+        'volume': 'CALLS',
+        'abandoned': {'column': 'ABANDONED count'},
+        'service_level': 'SERVICE LEVEL (%rec)',
+        'unit': "Call",
+        'icon': "📞",
+        'hourly_y_max': None,
+    },
+    'voice_sales': {
+        'title': "📞 SLA Voice Sales Hourly Dashboard",
+        'dirs': {
+            'Current': "Filtered/Voice_Sales_SLA",
+            'Before': "Filtered_before/SLA_PBI_VOICE HOURLY Inbound Sales",
+        },
+        'natural_key': ['DATE', 'HOUR', 'SKILL'],
+        'extra_dims': {},
+        'durations': {
+            'QUEUE': 'Average QUEUE WAIT TIME',
+            'HANDLE': 'Average HANDLE TIME',
+            'ACW': 'Average AFTER CALL WORK TIME',
+        },
+        'volume': 'CALLS',
+        'abandoned': {'column': 'ABANDONED count'},
+        'service_level': 'SERVICE LEVEL (%rec)',
+        'unit': "Call",
+        'icon': "📞",
+        'hourly_y_max': None,
+    },
+}
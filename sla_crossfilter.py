@@ -0,0 +1,110 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from sla_lod import expand_bucket
+
+# --- CONFIG ---
+CROSS_FILTER_LABELS = {
+    'day': "Day",
+    'cell': "Weekday × Hour",
+    'hour': "Hour",
+}
+
+
+# --- Collapse prepared rows into additive hourly cells; every chart is a small groupby of this
+def build_cube(df, dims, aggs):
+    return df.groupby(dims, sort=False).agg(**aggs).reset_index()
+
+
+# --- Turn (sum, count) pairs back into means after a cube rollup
+def finish_means(frame, means):
+    for name, (sum_col, n_col) in means.items():
+        frame[name] = frame[sum_col] / frame[n_col].replace(0, np.nan)
+    return frame
+
+
+# --- Cross-filter state: {source: (dims, {value tuples})}, one dict per dashboard
+def get_cross_filters(ns):
+    return st.session_state.setdefault(f'{ns}_xfilter', {})
+
+
+# --- Drop every cross-filter together with the chart selections that made them, so no
+# point stays highlighted once its filter is gone
+def clear_cross_filters(ns):
+    get_cross_filters(ns).clear()
+    for key in [k for k in st.session_state if k.startswith(f'{ns}_chart_')]:
+        del st.session_state[key]
+
+
+def _on_select(ns, source, key, dims, grain):
+    def callback():
+        points = st.session_state[key].selection.points
+        values = set()
+        for p in points:
+            if p.get('customdata') is None:
+                continue
+            # A clicked week/month point stands for every day it covers
+            options = [expand_bucket(v, grain) if d == 'DATE' else [v] for d, v in zip(dims, p['customdata'])]
+            values.update(itertools.product(*options))
+        filters = get_cross_filters(ns)
+        if values:
+            filters[source] = (dims, values)
+        else:
+            filters.pop(source, None)
+    return callback
+
+
+# --- Plotly chart whose clicked points (read from customdata) become a cross-filter
+def selectable_chart(fig, ns, source, name, dims, grain='D'):
+    key = f'{ns}_chart_{name}'
+    st.plotly_chart(
+        fig, width='content', key=key,
+        on_select=_on_select(ns, source, key, dims, grain), selection_mode='points',
+    )
+
+
+# --- Apply every active cross-filter except the one the target chart itself produces
+def apply_cross_filters(cube, filters, exclude=None):
+    mask = np.ones(len(cube), dtype=bool)
+    for source, (dims, values) in filters.items():
+        if source == exclude:
+            continue
+        if len(dims) == 1:
+            mask &= cube[dims[0]].isin([v[0] for v in values]).to_numpy()
+        else:
+            mask &= pd.MultiIndex.from_frame(cube[dims]).isin(list(values))
+    return cube[mask]
+
+
+# --- Active filter summary with a one-click reset
+def render_cross_filter_bar(ns):
+    filters = get_cross_filters(ns)
+    if not filters:
+        st.caption("💡 Click a heatmap cell, a day on a daily chart or an hour bar to filter every other chart (shift-click to add more).")
+        return
+    parts = []
+    for source, (dims, values) in filters.items():
+        shown = sorted(
+            " ".join(v.strftime('%Y-%m-%d') if isinstance(v, pd.Timestamp) else str(v) for v in value)
+            for value in values
+        )
+        parts.append(f"**{CROSS_FILTER_LABELS.get(source, source)}**: {', '.join(shown)}")
+    col1, col2 = st.columns([6, 1])
+    col1.info("🎯 Cross-filter — " + " · ".join(parts))
+    col2.button("✖ Clear", key=f'{ns}_xfilter_clear', on_click=clear_cross_filters, args=(ns,))
+
+
+# --- Heatmaps can't be selected in Plotly, so lay a near-invisible clickable marker on each cell
+def add_cell_targets(fig, heat, z):
+    fig.add_trace(go.Scatter(
+        x=heat['HOUR'], y=heat['WEEKDAY'], mode='markers',
+        marker=dict(symbol='square', size=22, opacity=0.01),
+        customdata=heat[['WEEKDAY', 'HOUR', z]].to_numpy(),
+        hovertemplate="%{customdata[0]} %{customdata[1]}<br>" + z + ": %{customdata[2]:,}<extra></extra>",
+        showlegend=False,
+    ))
+    return fig
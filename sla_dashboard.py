@@ -0,0 +1,324 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from sla_channels import CHANNELS
+from sla_crossfilter import (
+    add_cell_targets, apply_cross_filters, clear_cross_filters, finish_means,
+    get_cross_filters, render_cross_filter_bar, selectable_chart,
+)
+from sla_lod import GRAIN_LABELS, MAX_BAR_LABELS, bucket_dates, choose_grain
+from sla_pipeline import get_trend_store, load_cube, run_significance, significance_metrics
+from sla_quality import summarize_quarantine
+from sla_trends import trend_overlays
+
+# --- CONFIG ---
+FIGURE_CACHE_ENTRIES = 256
+
+
+# --- One dashboard for any channel in CHANNELS; sections follow the channel spec
+def run_dashboard(channel):
+    spec = CHANNELS[channel]
+    NS = channel
+
+    # --- Start of App ---
+    st.title(spec['title'])
+
+    try:
+        cube, reports, version = load_cube(channel)
+        ingest_report = reports['ingest_report']
+        if not ingest_report.empty:
+            dup_files = ingest_report['ROWS_DROPPED'].isna().sum()
+            dup_rows = int(ingest_report['ROWS_DROPPED'].sum())
+            with st.expander(f"🧹 Ingest deduplication: {dup_files} duplicate file(s), {dup_rows:,} overlapping row(s) dropped"):
+                st.dataframe(ingest_report, width='stretch', hide_index=True)
+
+        # --- Data quality: checks ran once at ingest; failing rows are kept out of every chart
+        quarantined, checks = reports['quarantine'], reports['quality_checks']
+        bad_rows = len(quarantined.drop_duplicates(['PERIOD', 'SOURCE_FILE', 'SOURCE_LINE']))
+        rows_checked = int(checks['ROWS_CHECKED'].iloc[0]) if not checks.empty else 0
+        with st.expander(f"🩺 Data quality: {bad_rows:,} of {rows_checked:,} row(s) quarantined from {quarantined['SOURCE_FILE'].nunique()} file(s)"):
+            st.dataframe(checks.drop(columns='ROWS_CHECKED'), width='stretch', hide_index=True)
+            if bad_rows:
+                st.markdown("**Quarantined rows by file**")
+                st.dataframe(summarize_quarantine(quarantined), width='stretch', hide_index=True)
+                st.markdown("**Quarantined values**")
+                st.dataframe(quarantined, width='stretch', hide_index=True)
+
+        # --- Streaming trend state, fed with the new days once per cube version
+        trend_store = get_trend_store(channel, cube, version)
+
+        # --- Sidebar Filters (keyed {NS}_filter_*, so a reset can drop them back to their defaults)
+        st.sidebar.header("🔎 Filters")
+        if st.sidebar.button("🔄 Reset All Filters"):
+            for key in [k for k in st.session_state if k.startswith(f'{NS}_filter_')]:
+                del st.session_state[key]
+            clear_cross_filters(NS)
+            st.rerun()
+
+        selected_periods = st.sidebar.multiselect("Dataset Period", ['Current', 'Before'], default=['Current', 'Before'], key=f'{NS}_filter_period')
+        cube = cube[cube['PERIOD'].isin(selected_periods)]
+
+        skill_filter = st.sidebar.multiselect("Skill", cube['SKILL'].unique(), default=cube['SKILL'].unique(), key=f'{NS}_filter_skill')
+        extra_filters = {
+            col: st.sidebar.multiselect(label, cube[col].unique(), default=cube[col].unique(), key=f'{NS}_filter_{col}')
+            for col, label in spec['extra_dims'].items()
+        }
+
+        min_date = cube['DATE'].min()
+        max_date = cube['DATE'].max()
+        date_range = st.sidebar.date_input("Date Range", value=(min_date, max_date), min_value=min_date, max_value=max_date, key=f'{NS}_filter_dates')
+
+        hour_options = sorted(cube['HOUR'].dropna().unique(), key=lambda x: int(str(x).split(":")[0]))
+        hour_filter = st.sidebar.multiselect("Hour(s)", hour_options, default=hour_options, key=f'{NS}_filter_hour')
+
+        weekday_options = list(cube['WEEKDAY'].unique())
+        weekday_filter = st.sidebar.multiselect("Weekday(s)", weekday_options, default=weekday_options, key=f'{NS}_filter_weekday')
+
+        peak_filter = st.sidebar.multiselect("Time Type", ['Peak', 'Off-Peak'], default=['Peak', 'Off-Peak'], key=f'{NS}_filter_peak')
+
+        mask = (
+            cube['SKILL'].isin(skill_filter) &
+            cube['HOUR'].isin(hour_filter) &
+            cube['WEEKDAY'].isin(weekday_filter) &
+            cube['PEAK_LABEL'].isin(peak_filter) &
+            cube['DATE'].between(pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1]))
+        )
+        for col, selected in extra_filters.items():
+            mask &= cube[col].isin(selected)
+        cube_filtered = cube[mask]
+
+        render_views(channel, cube_filtered, trend_store, version, selected_periods, skill_filter, date_range)
+
+    except Exception as e:
+        st.error(f"⚠️ Error loading data: {e}")
+        st.info("Make sure your folders and files are valid and correctly formatted.")
+
+
+# --- Everything chart clicks change. It runs as a fragment, so a click reruns only this part
+# (not the sidebar, ingest reports or trend store), and each figure comes from a cache keyed
+# on the aggregate it plots, so a chart whose data the click didn't change is not rebuilt.
+@st.fragment
+def render_views(channel, cube_filtered, trend_store, version, selected_periods, skill_filter, date_range):
+    spec = CHANNELS[channel]
+    NS = channel
+    unit, icon = spec['unit'], spec['icon']
+    has_slvl = bool(spec['service_level'])
+    has_resolved = 'RESOLVED' in cube_filtered
+
+    # --- Cross-filters from chart clicks; each chart ignores the filter it produces itself
+    xfilters = get_cross_filters(NS)
+    render_cross_filter_bar(NS)
+    cube_all = apply_cross_filters(cube_filtered, xfilters)
+    cube_day = apply_cross_filters(cube_filtered, xfilters, exclude='day')
+    cube_cell = apply_cross_filters(cube_filtered, xfilters, exclude='cell')
+    cube_hour = apply_cross_filters(cube_filtered, xfilters, exclude='hour')
+
+    # --- Level of detail: long ranges roll up to weeks/months so payloads stay bounded
+    grain = choose_grain(date_range[0], date_range[1])
+    if grain != 'D':
+        st.caption(f"📉 Long date range selected: daily charts show {GRAIN_LABELS[grain]} figures.")
+
+    means = {
+        'AVG_QUEUE': ('QUEUE_SUM', 'QUEUE_N'),
+        'AVG_HANDLE': ('HANDLE_SUM', 'HANDLE_N'),
+        'AVG_ACW': ('ACW_SUM', 'ACW_N'),
+    }
+    if has_slvl:
+        means['AVG_SLVL'] = ('SLVL_SUM', 'SLVL_N')
+    sums = [c for c in ['VOLUME', 'ABANDONED', 'RESOLVED', 'QUEUE_SUM', 'QUEUE_N', 'HANDLE_SUM', 'HANDLE_N', 'ACW_SUM', 'ACW_N', 'SLVL_SUM', 'SLVL_N', 'ROWS'] if c in cube_filtered]
+
+    # --- Daily Aggregation
+    daily = cube_day.groupby([bucket_dates(cube_day['DATE'], grain), 'PERIOD'])[sums].sum().reset_index()
+    finish_means(daily, means)
+    daily['% ABANDONED'] = (daily['ABANDONED'] / daily['VOLUME']) * 100
+
+    # --- Scorecard Metrics (aggregated by period)
+    st.markdown("### 📌 Summary Metrics by Period")
+    summary = cube_all.groupby('PERIOD').agg(
+        **{c: (c, 'sum') for c in sums},
+        MAX_Q=('QUEUE_MAX', 'max'),
+        MIN_Q=('QUEUE_MIN', 'min')
+    ).reset_index()
+    finish_means(summary, means)
+    summary['% ABANDONED'] = (summary['ABANDONED'] / summary['VOLUME']) * 100
+    if has_resolved:
+        summary['% RESOLVED'] = (summary['RESOLVED'] / summary['VOLUME']) * 100
+
+    for _, row in summary.iterrows():
+        st.markdown(f"#### 📅 {row['PERIOD']} Period")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric(f"{icon} Total {unit}s", f"{int(row['VOLUME']):,}")
+            st.metric("🚫 Abandoned", f"{int(row['ABANDONED']):,}")
+            if has_resolved:
+                st.metric("✅ Resolved", f"{int(row['RESOLVED']):,}")
+            if has_slvl:
+                st.metric("🎯 SL %", f"{row['AVG_SLVL']:.1f}%")
+        with col2:
+            st.metric("⏳ Avg Queue Time", f"{row['AVG_QUEUE'] / 60:.2f} mins")
+            st.metric("🕒 Avg Handle Time", f"{row['AVG_HANDLE'] / 60:.2f} mins")
+            st.metric("🧾 Avg ACW", f"{row['AVG_ACW'] / 60:.2f} mins")
+        with col3:
+            st.metric("📉 % Abandoned", f"{row['% ABANDONED']:.1f}%")
+            if has_resolved:
+                st.metric("💯 Resolution Rate", f"{row['% RESOLVED']:.1f}%")
+            st.metric("⏱️ Max Queue Time", f"{row['MAX_Q'] / 60:.2f} mins")
+            st.metric("⏱️ Min Queue Time", f"{row['MIN_Q'] / 60:.2f} mins")
+
+    # --- Trend lines by Period, each with rolling averages and anomaly markers
+    trends = [
+        ('% ABANDONED', "📉 Abandonment Rate Over Time by Period", "Abandonment % Over Time by Dataset Period", 'trend_abandon'),
+        ('AVG_ACW', "🧾 Average ACW Trend by Period", "Average After Work Time Over Time", 'trend_acw'),
+    ]
+    if has_slvl:
+        trends.append(('AVG_SLVL', "🎯 Service Level Trend by Period", "Service Level (%) Over Time", 'trend_slvl'))
+    for i, (metric, heading, title, name) in enumerate(trends):
+        st.markdown(f"### {heading}")
+        if i == 0:
+            st.caption("Dotted/dashed lines are 7- and 28-day rolling averages; ✕ marks days where a selected skill breaks from its EWMA baseline (|z| > 3). Both cover all hours; on weekly/monthly charts a ✕ sits on the week/month containing the flagged day.")
+        fig_trend = trend_figure(
+            daily[['DATE', 'PERIOD', metric]], metric, title,
+            trend_store, version, skill_filter, selected_periods, date_range, grain,
+        )
+        selectable_chart(fig_trend, NS, 'day', name, ['DATE'], grain)
+
+    # --- Heatmap Comparison
+    st.markdown(f"### 🔥 {unit} Volume Heatmap (Day vs Hour) per Period")
+    heat_df = cube_cell.groupby(['PERIOD', 'WEEKDAY', 'HOUR'])['VOLUME'].sum().reset_index()
+
+    for period in heat_df['PERIOD'].unique():
+        st.markdown(f"#### 📅 {period} Period")
+        fig_heat = heatmap_figure(heat_df[heat_df['PERIOD'] == period], period, unit)
+        selectable_chart(fig_heat, NS, 'cell', f'heat_{period}', ['WEEKDAY', 'HOUR'])
+
+    # --- Total vs Abandoned per Day (Stacked View)
+    st.markdown(f"### 📊 Total vs Abandoned {unit}s per Day (Stacked View)")
+    fig_stacked = stacked_figure(daily[['DATE', 'PERIOD', 'VOLUME', 'ABANDONED']], unit)
+    selectable_chart(fig_stacked, NS, 'day', 'stacked', ['DATE'], grain)
+
+    # --- Hourly Aggregation (Combined View)
+    st.markdown("### ⏱️ Hourly Aggregated Metrics (Combined View)")
+    hourly = cube_hour.groupby(['HOUR', 'PERIOD'])[['VOLUME', 'ABANDONED']].sum().reset_index()
+    fig_hourly = hourly_figure(hourly, unit, spec['hourly_y_max'])
+    selectable_chart(fig_hourly, NS, 'hour', 'hourly', ['HOUR'])
+
+    # --- Before vs Current Significance
+    st.markdown("### 🧪 Before vs Current Significance by Skill")
+    if st.toggle("Run significance tests", value=False):
+        compare_by = st.radio("Compare by", ['Skill', 'Skill & Hour'], horizontal=True)
+        group_cols = ['SKILL'] if compare_by == 'Skill' else ['SKILL', 'HOUR']
+        tested = sorted({c for num, den, _ in significance_metrics(channel).values() for c in (num, den) if c})
+        sig = run_significance(channel, cube_all[['PERIOD', 'DATE', 'SKILL', 'HOUR', *tested]], group_cols)
+        st.caption("Day-level permutation tests on the filtered data; Q_VALUE is Benjamini-Hochberg adjusted and SIGNIFICANT means Q_VALUE < 0.05.")
+        if not sig.empty:
+            if st.checkbox("Only significant changes", value=True):
+                sig = sig[sig['SIGNIFICANT']]
+            st.dataframe(sig.sort_values(['Q_VALUE', 'P_VALUE']), width='stretch', hide_index=True)
+
+
+# --- Figures, cached on the aggregate they plot. They are shared by every session, so nothing
+# may modify one after it is built.
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def trend_figure(daily, metric, title, _trend_store, version, skills, periods, date_range, grain):
+    fig = px.line(
+        daily,
+        x='DATE',
+        y=metric,
+        color='PERIOD',
+        title=title,
+        markers=True,
+        labels={'AVG_ACW': 'ACW (s)', 'AVG_SLVL': 'Service Level (%)'},
+        custom_data=['DATE'],
+        render_mode='webgl',
+        width=1000,
+        height=400
+    )
+    return fig.add_traces(overlay_traces(_trend_store, version, metric, skills, periods, date_range, grain))
+
+
+# Rolling lines and anomaly markers don't depend on the cross-filters, so they are shared by
+# every trend figure built for the same sidebar selection
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def overlay_traces(_trend_store, version, metric, skills, periods, date_range, grain):
+    return trend_overlays(_trend_store, metric, skills, periods, date_range, grain)
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def heatmap_figure(period_heat, period, unit):
+    fig = px.density_heatmap(
+        period_heat,
+        x='HOUR',
+        y='WEEKDAY',
+        z='VOLUME',
+        color_continuous_scale='Blues',
+        title=f"{period} - {unit} Volume by Hour & Weekday",
+        labels={'VOLUME': f"{unit}s"},
+        width=1000,
+        height=500
+    )
+    return add_cell_targets(fig, period_heat, 'VOLUME')
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def stacked_figure(daily, unit):
+    abandoned_label = f"Abandoned {unit}s"
+    kept_label = f"Non-Abandoned {unit}s"
+
+    # Melt for stacked format (Abandoned first to appear on bottom)
+    stack_df = daily.assign(**{abandoned_label: daily['ABANDONED'], kept_label: daily['VOLUME'] - daily['ABANDONED']})
+    stack_df = stack_df.melt(
+        id_vars=['DATE', 'PERIOD'],
+        value_vars=[abandoned_label, kept_label],  # Order matters!
+        var_name='Type',
+        value_name='Count'
+    )
+    stack_df['ColorKey'] = stack_df['PERIOD'] + ' - ' + stack_df['Type']
+    custom_color_map = {
+        f'Before - {abandoned_label}': '#fca5a5',  # Light red
+        f'Before - {kept_label}': '#bfdbfe',       # Light blue
+        f'Current - {abandoned_label}': '#dc2626', # Deep red
+        f'Current - {kept_label}': '#3b82f6',      # Vivid blue
+    }
+    fig = px.bar(
+        stack_df,
+        x='DATE',
+        y='Count',
+        color='ColorKey',
+        color_discrete_map=custom_color_map,
+        title=f"Total vs Abandoned {unit}s per Day (Stacked View)",
+        labels={'ColorKey': 'Period & Type'},
+        custom_data=['DATE'],
+        height=600,
+        width=1000,
+    )
+    fig.update_layout(barmode='stack')
+    return fig
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def hourly_figure(hourly, unit, y_max):
+    total_label = f"Total {unit}s"
+    abandoned_label = f"Abandoned {unit}s"
+    hourly_chart_df = hourly.rename(columns={'VOLUME': total_label, 'ABANDONED': abandoned_label}).melt(
+        id_vars=['HOUR', 'PERIOD'],
+        value_vars=[abandoned_label, total_label],
+        var_name='Type',
+        value_name='Count'
+    )
+    fig = px.bar(
+        hourly_chart_df,
+        x='HOUR',
+        y='Count',
+        color='PERIOD',
+        barmode='group',
+        facet_row='Type',
+        custom_data=['HOUR'],
+        title=f"Total vs Abandoned {unit}s per Hour (Before vs Current)",
+        text_auto=len(hourly_chart_df) <= MAX_BAR_LABELS,
+        height=700,
+        width=1000
+    )
+    if y_max:
+        fig.update_yaxes(range=[0, y_max])
+    return fig
@@ -0,0 +1,77 @@
+import datetime
+import hashlib
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# --- CONFIG ---
+HASH_BLOCK = 1 << 20
+EXPORT_DATE = re.compile(r'^(\d{2})_(\d{2})_(\d{4})_')  # MM_DD_YYYY_ file-name prefix
+
+
+# --- SHA-256 of a file's bytes, read in blocks
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for block in iter(lambda: fh.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# --- Export time for ordering: the date in the file name, else the file's mtime
+def export_time(path, name):
+    match = EXPORT_DATE.match(name)
+    if match:
+        month, day, year = map(int, match.groups())
+        try:
+            return datetime.datetime(year, month, day).timestamp()
+        except ValueError:
+            pass
+    return os.path.getmtime(os.path.join(path, name))
+
+
+# --- Load every CSV in a folder once, dropping re-exported files and overlapping rows.
+# Files are read oldest export first; when exports overlap, the latest export of a key wins.
+# Also returns each loaded file's header columns, for the schema check.
+def load_csv_folder(path, key_cols):
+    all_files = sorted(
+        (f for f in os.listdir(path) if f.endswith(".csv")),
+        key=lambda name: (export_time(path, name), name),
+    )
+    report = []
+    seen_digests = {}
+    headers = {}
+    df_list = []
+    for name in all_files:
+        digest = file_digest(os.path.join(path, name))
+        if digest in seen_digests:
+            report.append({'FILE': name, 'REASON': f"Same content as {seen_digests[digest]}", 'ROWS_DROPPED': None})
+            continue
+        seen_digests[digest] = name
+        part = pd.read_csv(os.path.join(path, name))
+        headers[name] = list(part.columns)
+        part['SOURCE_FILE'] = name
+        part['SOURCE_LINE'] = range(2, len(part) + 2)  # line 1 is the header
+        df_list.append(part)
+
+    if not df_list:
+        return pd.DataFrame(), pd.DataFrame(report, columns=['FILE', 'REASON', 'ROWS_DROPPED']), headers
+    df = pd.concat(df_list, ignore_index=True)
+
+    # A key can repeat legitimately inside one export (e.g. one chat row per interaction),
+    # so repeats within a file are all kept. Across files, the latest export holding a key
+    # replaces that key's rows as a whole: every earlier file's rows for it are dropped,
+    # however many the later export has.
+    key_cols = [c for c in key_cols if c in df.columns]
+    file_order = pd.Series(np.repeat(np.arange(len(df_list)), [len(part) for part in df_list]))
+    key_hash = pd.util.hash_pandas_object(df[key_cols], index=False)
+    dup = (file_order < file_order.groupby(key_hash.to_numpy()).transform('max')).to_numpy()
+    if dup.any():
+        dropped = df.loc[dup, 'SOURCE_FILE'].value_counts(sort=False)
+        for name, count in dropped.items():
+            report.append({'FILE': name, 'REASON': "Rows superseded by a later export", 'ROWS_DROPPED': int(count)})
+        df = df[~dup].reset_index(drop=True)
+
+    return df, pd.DataFrame(report, columns=['FILE', 'REASON', 'ROWS_DROPPED']), headers
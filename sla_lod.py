@@ -0,0 +1,33 @@
+import pandas as pd
+
+# --- CONFIG ---
+MAX_POINTS = 180
+MAX_BAR_LABELS = 60
+GRAIN_LABELS = {'D': "daily", 'W': "weekly", 'M': "monthly"}
+_PERIOD_FREQ = {'W': 'W-SUN', 'M': 'M'}
+
+
+# --- Coarsest grain needed to keep a series at or under MAX_POINTS over the selected range
+def choose_grain(start, end, max_points=MAX_POINTS):
+    n_days = (pd.to_datetime(end) - pd.to_datetime(start)).days + 1
+    if n_days <= max_points:
+        return 'D'
+    if n_days / 7 <= max_points:
+        return 'W'
+    return 'M'
+
+
+# --- Map each date to the first day of its bucket (weeks start on Monday)
+def bucket_dates(dates, grain):
+    if grain == 'D':
+        return dates
+    return dates.dt.to_period(_PERIOD_FREQ[grain]).dt.start_time
+
+
+# --- Every day covered by the bucket starting at `start`
+def expand_bucket(start, grain):
+    start = pd.Timestamp(start).normalize()
+    if grain == 'D':
+        return [start]
+    end = pd.Period(start, freq=_PERIOD_FREQ[grain]).end_time.normalize()
+    return list(pd.date_range(start, end))
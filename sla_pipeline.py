@@ -0,0 +1,235 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from sla_channels import CHANNELS
+from sla_crossfilter import build_cube
+from sla_ingest import load_csv_folder
+from sla_quality import HOUR_PATTERN, blank, quarantine, schema_failures, unparsed
+from sla_shared import dataset_path, open_shared, publish, shared_lock, source_fingerprint
+from sla_significance import compare_periods
+from sla_trends import TrendStore
+
+# --- CONFIG ---
+DATE_FORMAT = '%Y/%m/%d'
+PEAK_HOURS = (9, 18)
+DURATION_PATTERN = r'^(?P<SIGN>-)?(?:(?P<H>\d+):)?(?P<M>[0-5]?\d):(?P<S>[0-5]?\d(?:\.\d+)?)$'
+
+
+# --- HH:MM:SS or MM:SS text to seconds for a whole column (NaN where it won't parse,
+# including minutes or seconds of 60 and over).
+# Exports repeat the same few thousand durations, so only the distinct values are parsed.
+def to_seconds(values):
+    codes, uniques = pd.factorize(values.astype('string').str.strip())
+    parts = pd.Series(uniques, dtype='string').str.extract(DURATION_PATTERN)
+    hms = parts[['H', 'M', 'S']].astype(float)
+    seconds = hms['H'].fillna(0) * 3600 + hms['M'] * 60 + hms['S']
+    seconds = seconds.where(parts['SIGN'].isna(), -seconds).to_numpy()
+    return pd.Series(np.where(codes >= 0, seconds[codes], np.nan), index=values.index)
+
+
+# --- Exports use YYYY/MM/DD; anything else falls back to day-first parsing
+def parse_dates(values):
+    dates = pd.to_datetime(values, format=DATE_FORMAT, errors='coerce')
+    rest = dates.isna() & values.notna()
+    if rest.any():
+        dates[rest] = pd.to_datetime(values[rest], dayfirst=True, format='mixed', errors='coerce')
+    return dates
+
+
+# --- "NN.NN%" text to a number (NaN where blank or unreadable)
+def to_percent(values):
+    return pd.to_numeric(values.astype('string').str.strip().str.rstrip('%'), errors='coerce').astype(float)
+
+
+# --- 'HH:MM' hour to Peak/Off-Peak; unreadable hours are Off-Peak
+def peak_labels(hours):
+    hour = pd.to_numeric(hours.astype('string').str.split(':').str[0], errors='coerce')
+    return np.where(hour.between(*PEAK_HOURS), 'Peak', 'Off-Peak')
+
+
+# --- Load every folder with its dataset origin (duplicate files and re-exported rows are dropped here),
+# plus each file's header columns keyed by (PERIOD, SOURCE_FILE)
+def load_with_period_tag(channel):
+    spec = CHANNELS[channel]
+    frames, reports, headers = [], [], {}
+    for period, path in spec['dirs'].items():
+        df, report, folder_headers = load_csv_folder(path, spec['natural_key'])
+        frames.append(df.assign(PERIOD=period))
+        reports.append(report.assign(PERIOD=period))
+        headers.update({(period, name): cols for name, cols in folder_headers.items()})
+    df = pd.concat(frames, ignore_index=True)
+    df['SOURCE_FILE'] = df['SOURCE_FILE'].astype('category')
+    return df, pd.concat(reports, ignore_index=True), headers
+
+
+# --- Validation stage, run once per build: parses every checked column in one pass,
+# quarantines rows failing schema, parse or range checks and returns the parsed columns
+# on the rows that passed. Blank durations and service levels stay missing (NaN), even when
+# a whole file has them blank; blank dimensions and counts fail their row.
+def validate(df, spec, headers):
+    rule = spec['abandoned']
+    dims = ['DATE', 'HOUR', 'SKILL', *spec['extra_dims']]
+    numeric = [spec['volume']] + ([] if 'pattern' in rule else [rule['column']])
+    required = list(dict.fromkeys(
+        dims + numeric + [rule['column']] + list(spec['durations'].values())
+        + ([spec['service_level']] if spec['service_level'] else [])
+    ))
+    failures = schema_failures(df, required, headers)
+
+    parsed = {}
+    for col in dict.fromkeys(dims + [rule['column']]):
+        failures[(col, 'missing')] = blank(df[col]) & ~failures[(col, 'not in file header')]
+
+    parsed['DATE'] = parse_dates(df['DATE'])
+    failures[('DATE', 'unparseable')] = unparsed(df['DATE'], parsed['DATE'])
+    failures[('DATE', 'in the future')] = parsed['DATE'] > pd.Timestamp.today().normalize()
+    failures[('HOUR', 'not HH:MM')] = ~blank(df['HOUR']) & ~df['HOUR'].astype('string').str.strip().str.match(HOUR_PATTERN).fillna(False)
+
+    for col in numeric:
+        parsed[col] = pd.to_numeric(df[col], errors='coerce')
+        failures[(col, 'missing')] = blank(df[col]) & ~failures[(col, 'not in file header')]
+        failures[(col, 'unparseable')] = unparsed(df[col], parsed[col])
+        failures[(col, 'negative or fractional')] = (parsed[col] < 0) | (parsed[col] % 1 > 0)
+    if 'pattern' not in rule:
+        failures[(rule['column'], f"more than {spec['volume']}")] = parsed[rule['column']] > parsed[spec['volume']]
+
+    for name, col in spec['durations'].items():
+        parsed[f'{name}_S'] = to_seconds(df[col])
+        failures[(col, 'not HH:MM:SS')] = unparsed(df[col], parsed[f'{name}_S'])
+        failures[(col, 'negative')] = parsed[f'{name}_S'] < 0
+
+    if spec['service_level']:
+        col = spec['service_level']
+        parsed['SLVL'] = to_percent(df[col])
+        failures[(col, 'unparseable')] = unparsed(df[col], parsed['SLVL'])
+        failures[(col, 'outside 0-100%')] = ~parsed['SLVL'].between(0, 100) & parsed['SLVL'].notna()
+
+    clean, quarantined, checks = quarantine(df, failures)
+    clean = clean.assign(**{col: values[clean.index] for col, values in parsed.items()})
+    checks.insert(0, 'ROWS_CHECKED', len(df))
+    return clean, quarantined, checks
+
+
+# --- Prepared hourly cube from the raw CSVs. Measures are named the same for every
+# channel: VOLUME, ABANDONED, [RESOLVED], QUEUE_SUM/N/MAX/MIN, HANDLE_SUM/N, ACW_SUM/N,
+# [SLVL_SUM, SLVL_N], ROWS. Each *_N counts non-blank values and is the denominator
+# for its mean; ROWS counts every row.
+def build_channel_cube(channel):
+    spec = CHANNELS[channel]
+    df, ingest_report, headers = load_with_period_tag(channel)
+    df, quarantined, checks = validate(df, spec, headers)
+
+    df['VOLUME'] = df[spec['volume']].astype(int)
+    rule = spec['abandoned']
+    if 'pattern' in rule:
+        df['ABANDONED'] = df[rule['column']].str.contains(rule['pattern'], case=False, na=False).astype(int)
+        df['RESOLVED'] = 1 - df['ABANDONED']
+    else:
+        df['ABANDONED'] = df[rule['column']].astype(int)
+
+    df['WEEKDAY'] = df['DATE'].dt.day_name()
+    df['PEAK_LABEL'] = peak_labels(df['HOUR'])
+
+    aggs = dict(VOLUME=('VOLUME', 'sum'), ABANDONED=('ABANDONED', 'sum'))
+    if 'RESOLVED' in df:
+        aggs['RESOLVED'] = ('RESOLVED', 'sum')
+    aggs.update(
+        QUEUE_SUM=('QUEUE_S', 'sum'),
+        QUEUE_N=('QUEUE_S', 'count'),
+        QUEUE_MAX=('QUEUE_S', 'max'),
+        QUEUE_MIN=('QUEUE_S', 'min'),
+        HANDLE_SUM=('HANDLE_S', 'sum'),
+        HANDLE_N=('HANDLE_S', 'count'),
+        ACW_SUM=('ACW_S', 'sum'),
+        ACW_N=('ACW_S', 'count'),
+    )
+    if 'SLVL' in df:
+        aggs.update(SLVL_SUM=('SLVL', 'sum'), SLVL_N=('SLVL', 'count'))
+    aggs['ROWS'] = ('QUEUE_S', 'size')
+
+    dims = ['PERIOD', 'SKILL', *spec['extra_dims'], 'DATE', 'WEEKDAY', 'HOUR', 'PEAK_LABEL']
+    return build_cube(df, dims, aggs), {'ingest_report': ingest_report, 'quarantine': quarantined, 'quality_checks': checks}
+
+
+# --- Cube for a channel, built once per input version and shared by every server process
+# through a memory-mapped Arrow file, plus its ingest reports ('ingest_report', 'quarantine',
+# 'quality_checks') and a version id that changes whenever the inputs do. Everything
+# returned is shared too: callers must not modify it.
+# Each channel holds only its current version, so a new one replaces it in place. A new
+# version is checked, built and opened under the cross-process lock, with the inputs
+# fingerprinted again there in case they changed while waiting for it.
+def load_cube(channel):
+    spec = CHANNELS[channel]
+    path = dataset_path(channel, source_fingerprint(spec))
+    slot = _cube_slot(channel)
+    with slot['lock']:
+        if slot['path'] != path:
+            with shared_lock(channel):
+                path = dataset_path(channel, source_fingerprint(spec))
+                if not os.path.exists(path):
+                    publish(path, *build_channel_cube(channel))
+                slot['data'] = open_shared(path)
+            slot['path'] = path
+        cube, reports = slot['data']
+    return cube, reports, os.path.basename(path)
+
+
+@st.cache_resource
+def _cube_slot(channel):
+    return {'lock': threading.Lock(), 'path': None, 'data': None}
+
+
+# --- Per-skill daily sums behind the trend lines
+def daily_skill_totals(cube):
+    sums = [c for c in ['VOLUME', 'ABANDONED', 'ACW_SUM', 'ACW_N', 'SLVL_SUM', 'SLVL_N', 'ROWS'] if c in cube]
+    return cube.groupby(['PERIOD', 'SKILL', 'DATE'])[sums].sum().reset_index()
+
+
+@st.cache_resource
+def _trend_slot(channel):
+    return {'lock': threading.Lock(), 'version': None, 'store': None}
+
+
+# --- Streaming rolling/anomaly state, kept across reruns and sessions and fed once per cube
+# version. A version that only adds days after each series' last one (a new daily export)
+# keeps the store and pushes just those days; one that revises history already pushed
+# (backfilled, re-exported or differently quarantined days) starts a fresh store.
+def get_trend_store(channel, cube, version):
+    slot = _trend_slot(channel)
+    with slot['lock']:
+        if slot['version'] != version:
+            daily = daily_skill_totals(cube)
+            if slot['store'] is None or not slot['store'].extends(daily):
+                slot['store'] = _new_trend_store(channel)
+            slot['store'].ingest(daily)
+            slot['version'] = version
+        return slot['store']
+
+
+def _new_trend_store(channel):
+    metrics = {
+        '% ABANDONED': ('ABANDONED', 'VOLUME', 100),
+        'AVG_ACW': ('ACW_SUM', 'ACW_N', 1),
+    }
+    if CHANNELS[channel]['service_level']:
+        metrics['AVG_SLVL'] = ('SLVL_SUM', 'SLVL_N', 1)
+    return TrendStore(metrics)
+
+
+# --- (num, den, scale) per tested metric
+def significance_metrics(channel):
+    metrics = {'% ABANDONED': ('ABANDONED', 'VOLUME', 100)}
+    if CHANNELS[channel]['service_level']:
+        metrics['SERVICE LEVEL (%)'] = ('SLVL_SUM', 'SLVL_N', 1)
+    metrics['AVG_QUEUE (s)'] = ('QUEUE_SUM', 'QUEUE_N', 1)
+    return metrics
+
+
+# --- Before vs Current permutation tests, cached per filter selection
+@st.cache_data
+def run_significance(channel, df, group_cols):
+    return compare_periods(df, group_cols, significance_metrics(channel))
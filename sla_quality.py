@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+# --- CONFIG ---
+QUARANTINE_COLUMNS = ['PERIOD', 'SOURCE_FILE', 'SOURCE_LINE', 'COLUMN', 'PROBLEM', 'VALUE']
+HOUR_PATTERN = r'^([01]?\d|2[0-3]):[0-5]\d(:[0-5]\d)?$'
+
+
+# --- Missing or whitespace-only cells
+def blank(values):
+    return (values.isna() | values.astype('string').str.strip().eq('')).fillna(True)
+
+
+# --- Parse failures: cells that have text but no parsed value
+def unparsed(raw, parsed):
+    return parsed.isna() & ~blank(raw)
+
+
+# --- Schema: a required column absent from a file's header fails every row of that file
+# (absent columns are added empty so the row checks can still run). headers maps
+# (PERIOD, SOURCE_FILE) -> that file's header columns. A column that is present but blank
+# is left to the row checks.
+def schema_failures(df, columns, headers):
+    codes, files = pd.MultiIndex.from_arrays([df['PERIOD'], df['SOURCE_FILE']]).factorize()
+    failures = {}
+    for col in columns:
+        if col not in df:
+            df[col] = pd.NA
+        absent = np.array([col not in headers[file] for file in files], dtype=bool)
+        failures[(col, 'not in file header')] = absent[codes]
+    return failures
+
+
+# --- Split off every row failing any check. failures maps (column, problem) -> row mask;
+# the quarantine has one row per failed check, with the raw value and where it came from.
+def quarantine(df, failures):
+    keys = list(failures)
+    matrix = np.column_stack([np.asarray(pd.Series(mask).fillna(False), dtype=bool) for mask in failures.values()])
+    rows, checks = np.nonzero(matrix)
+    check_cols = np.array([col for col, _ in keys], dtype=object)[checks]
+
+    values = np.empty(len(rows), dtype=object)
+    for col in np.unique(check_cols):
+        sel = check_cols == col
+        values[sel] = df[col].astype('string').to_numpy()[rows[sel]]
+
+    quarantined = pd.DataFrame({
+        'PERIOD': df['PERIOD'].to_numpy()[rows],
+        'SOURCE_FILE': df['SOURCE_FILE'].astype(str).to_numpy()[rows],
+        'SOURCE_LINE': df['SOURCE_LINE'].to_numpy()[rows],
+        'COLUMN': check_cols,
+        'PROBLEM': np.array([problem for _, problem in keys], dtype=object)[checks],
+        'VALUE': values,
+    }, columns=QUARANTINE_COLUMNS)
+
+    summary = pd.DataFrame({
+        'COLUMN': [col for col, _ in keys],
+        'PROBLEM': [problem for _, problem in keys],
+        'ROWS_FAILED': matrix.sum(axis=0),
+    })
+    return df[~matrix.any(axis=1)], quarantined, summary
+
+
+# --- Quarantined rows per file and check, for the dashboard
+def summarize_quarantine(quarantined):
+    return (
+        quarantined.groupby(['PERIOD', 'SOURCE_FILE', 'COLUMN', 'PROBLEM'], sort=False)
+        .size().rename('ROWS').reset_index()
+        .sort_values('ROWS', ascending=False)
+    )
@@ -0,0 +1,98 @@
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock (it runs a single server process there)
+    fcntl = None
+
+import pyarrow as pa
+
+# --- CONFIG ---
+SHARED_DIR = os.environ.get('SLA_SHARED_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.sla_shared'))
+FORMAT_VERSION = 8  # bump when the layout of a published frame or the way it is built changes
+_MAIN = 'data'
+
+
+# --- Fingerprint of a channel's inputs: its spec plus every CSV's name, size and mtime
+def source_fingerprint(spec):
+    digest = hashlib.sha256(json.dumps([FORMAT_VERSION, spec], sort_keys=True, default=str).encode())
+    for path in sorted(spec['dirs'].values()):
+        with os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.endswith(".csv"):
+                    stat = entry.stat()
+                    digest.update(f"{path}/{entry.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def dataset_path(name, fingerprint):
+    return os.path.join(SHARED_DIR, f"{name}-{fingerprint}")
+
+
+# --- Exclusive lock on one dataset name, shared by every process using SHARED_DIR. Hold it
+# around checking, building, publishing and opening a version, so a version is built once
+# while the other processes wait for it, and nothing is pruned while it is being opened.
+@contextlib.contextmanager
+def shared_lock(name):
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    with open(os.path.join(SHARED_DIR, f"{name}.lock"), 'a') as fh:
+        if fcntl:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+# --- Publish a version as a folder of uncompressed Arrow IPC files: the main frame plus one
+# file per side table, so every frame can be mapped. Call it under shared_lock. The folder is
+# written under a temp name and renamed into place, so readers never see a partial version.
+# Temp folders left by a crashed build and versions published before this one are removed;
+# processes still mapping them keep their pages.
+def publish(path, frame, extras=None):
+    folder, current = os.path.split(path)
+    prefix = current.rsplit('-', 1)[0] + '-'
+    os.makedirs(folder, exist_ok=True)
+    for name in os.listdir(folder):
+        if name.startswith(prefix) and name.endswith(".tmp"):
+            shutil.rmtree(os.path.join(folder, name), ignore_errors=True)
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(tmp)
+    for key, part in {_MAIN: frame, **(extras or {})}.items():
+        table = pa.Table.from_pandas(part, preserve_index=False)
+        with pa.OSFile(os.path.join(tmp, f"{key}.arrow"), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # Another process published the same version first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    published = os.stat(path).st_mtime_ns
+    for name in os.listdir(folder):
+        other = os.path.join(folder, name)
+        if name.startswith(prefix) and name != current and os.path.isdir(other) and os.stat(other).st_mtime_ns < published:
+            shutil.rmtree(other, ignore_errors=True)
+
+
+# --- Map one published Arrow file read-only. Numeric/date columns are views on the mapping
+# and string columns stay Arrow-backed (pandas >= 3), so every process shares the OS page
+# cache copy.
+def _map_frame(path):
+    return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all().to_pandas(split_blocks=True)
+
+
+# --- Main frame and side tables of a published version
+def open_shared(path):
+    frames = {
+        name[:-len(".arrow")]: _map_frame(os.path.join(path, name))
+        for name in os.listdir(path) if name.endswith(".arrow")
+    }
+    return frames.pop(_MAIN), frames
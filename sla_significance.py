@@ -0,0 +1,116 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# --- CONFIG ---
+N_RESAMPLES = 1000
+CHUNK = 100
+ALPHA = 0.05
+SEED = 7
+
+
+# --- Count, per group, permutations whose |Current - Before| reaches the observed gap
+def _count_exceedances(seg, starts, is_current, sums, observed, n_resamples, seed):
+    rng = np.random.default_rng(seed)
+    exceed = {name: np.zeros(len(starts), dtype=np.int64) for name in sums}
+    for start in range(0, n_resamples, CHUNK):
+        size = min(CHUNK, n_resamples - start)
+        # Integer segment id + uniform noise sorts rows only within their own group,
+        # so every row of the matrix is an independent relabelling of every group at once
+        order = (seg + rng.random((size, len(seg)))).argsort(axis=1)
+        labels = is_current[order]
+        for name, (num, den, tot_num, tot_den) in sums.items():
+            p_num = np.add.reduceat(labels * num, starts, axis=1)
+            p_den = np.add.reduceat(labels * den, starts, axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                diff = p_num / p_den - (tot_num - p_num) / (tot_den - p_den)
+            # Small tolerance so permutations tying the observed split are counted
+            exceed[name] += (np.abs(diff) >= observed[name] - 1e-12).sum(axis=0)
+    return exceed
+
+
+# --- Benjamini-Hochberg adjusted p-values (NaNs pass through)
+def _fdr(p_values):
+    p = np.asarray(p_values, dtype=float)
+    q = np.full_like(p, np.nan)
+    ok = ~np.isnan(p)
+    if ok.any():
+        ranked = p[ok]
+        order = ranked.argsort()
+        m = len(ranked)
+        adj = ranked[order] * m / np.arange(1, m + 1)
+        adj = np.minimum.accumulate(adj[::-1])[::-1].clip(max=1)
+        out = np.empty(m)
+        out[order] = adj
+        q[ok] = out
+    return q
+
+
+# --- Permutation-test every group and metric for a Before vs Current shift
+def compare_periods(df, group_cols, metrics, n_resamples=N_RESAMPLES):
+    # metrics: {name: (numerator column, denominator column or None for a plain mean, scale)}
+    # Collapse to one (num, den) pair per group and day: days are the resampling unit,
+    # which keeps arrays small and respects the correlation between rows of the same day
+    parts = {}
+    for name, (num_col, den_col, scale) in metrics.items():
+        num = df[num_col].astype(float) * scale
+        den = df[den_col].astype(float) if den_col else pd.Series(1.0, index=df.index)
+        # Rows with a missing value can't contribute to either side
+        valid = num.notna() & den.notna()
+        parts[f'{name}|num'] = num.where(valid, 0.0)
+        parts[f'{name}|den'] = den.where(valid, 0.0)
+    keys = [df[c] for c in group_cols + ['PERIOD', 'DATE']]
+    days = pd.DataFrame(parts).groupby(keys, sort=True).sum().reset_index()
+    if days.empty:
+        return pd.DataFrame()
+
+    grouped = days.groupby(group_cols, sort=True)
+    seg = grouped.ngroup().to_numpy()
+    starts = np.flatnonzero(np.r_[True, seg[1:] != seg[:-1]])
+    is_current = (days['PERIOD'] == 'Current').to_numpy()
+    n_current = np.add.reduceat(is_current.astype(np.int64), starts)
+    n_before = np.diff(np.r_[starts, len(seg)]) - n_current
+
+    out = grouped.size().reset_index()[group_cols]
+    sums, observed, frames = {}, {}, []
+    for name in metrics:
+        num = days[f'{name}|num'].to_numpy()
+        den = days[f'{name}|den'].to_numpy()
+        tot_num, tot_den = np.add.reduceat(num, starts), np.add.reduceat(den, starts)
+        cur_num = np.add.reduceat(num * is_current, starts)
+        cur_den = np.add.reduceat(den * is_current, starts)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            current = cur_num / cur_den
+            before = (tot_num - cur_num) / (tot_den - cur_den)
+        sums[name] = (num, den, tot_num, tot_den)
+        observed[name] = np.abs(current - before)
+        frame = out.copy()
+        frame['METRIC'] = name
+        frame['N_BEFORE'] = n_before
+        frame['N_CURRENT'] = n_current
+        frame['BEFORE'] = before
+        frame['CURRENT'] = current
+        frame['CHANGE'] = current - before
+        frames.append(frame)
+
+    # argsort/reduceat release the GIL, so each worker takes a share of the resamples on its own core
+    workers = max(1, min(os.cpu_count() or 1, n_resamples // CHUNK))
+    shares = [n_resamples // workers + (i < n_resamples % workers) for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        counts = list(pool.map(
+            lambda i: _count_exceedances(seg, starts, is_current, sums, observed, shares[i], SEED + i),
+            range(workers),
+        ))
+
+    for frame, name in zip(frames, metrics):
+        exceed = sum(c[name] for c in counts)
+        p = (exceed + 1) / (n_resamples + 1)
+        # Groups missing one period, or with nothing to compare, get no p-value
+        frame['P_VALUE'] = np.where(np.isnan(observed[name]), np.nan, p)
+
+    result = pd.concat(frames, ignore_index=True)
+    result['Q_VALUE'] = _fdr(result['P_VALUE'])
+    result['SIGNIFICANT'] = result['Q_VALUE'] < ALPHA
+    return result
@@ -0,0 +1,202 @@
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from sla_lod import bucket_dates
+
+# --- CONFIG ---
+TREND_WINDOWS = (7, 28)
+EWMA_ALPHA = 0.1
+ANOMALY_Z = 3.0
+ANOMALY_WARMUP = 14
+
+
+# --- Rolling sum of (numerator, denominator) over the last N calendar days
+class RollingWindow:
+    def __init__(self, days):
+        self.span = pd.Timedelta(days=days)
+        self.items = deque()
+        self.num = 0.0
+        self.den = 0.0
+
+    def push(self, date, num, den):
+        self.items.append((date, num, den))
+        self.num += num
+        self.den += den
+        # Each day enters and leaves the window once, so this is amortised O(1)
+        while date - self.items[0][0] >= self.span:
+            _, old_num, old_den = self.items.popleft()
+            self.num -= old_num
+            self.den -= old_den
+        return self.num, self.den
+
+
+# --- Exponentially weighted mean/variance, scoring each value before absorbing it
+class EwmaDetector:
+    def __init__(self, alpha=EWMA_ALPHA):
+        self.alpha = alpha
+        self.mean = None
+        self.var = 0.0
+        self.count = 0
+
+    def update(self, value):
+        if self.mean is None:
+            self.mean = value
+            self.count = 1
+            return np.nan
+        diff = value - self.mean
+        std = np.sqrt(self.var)
+        if std > 0:
+            z = diff / std
+        else:
+            z = 0.0 if diff == 0 else np.copysign(np.inf, diff)
+        incr = self.alpha * diff
+        self.mean += incr
+        self.var = (1 - self.alpha) * (self.var + diff * incr)
+        self.count += 1
+        return z if self.count > ANOMALY_WARMUP else np.nan
+
+
+# --- Streaming state for one (PERIOD, SKILL, METRIC) series
+class SkillTrend:
+    def __init__(self, scale):
+        self.scale = scale
+        self.windows = {days: RollingWindow(days) for days in TREND_WINDOWS}
+        self.ewma = EwmaDetector()
+
+    def push(self, date, num, den):
+        value = num / den * self.scale if den else np.nan
+        record = {'VALUE': value, 'NUM': num, 'DEN': den}
+        for days, window in self.windows.items():
+            record[f'R{days}_NUM'], record[f'R{days}_DEN'] = window.push(date, num, den)
+        z = self.ewma.update(value) if den else np.nan
+        record['Z'] = z
+        record['ANOMALY'] = bool(abs(z) > ANOMALY_Z) if not np.isnan(z) else False
+        return record
+
+
+# --- Holds every series for one dashboard; only days newer than what it has seen are pushed
+class TrendStore:
+    def __init__(self, metrics):
+        # metrics: {name: (numerator column, denominator column, scale)}
+        self.metrics = metrics
+        self.series = {}
+        self.last_date = {}
+        self.daily = None  # per-skill daily totals ingested so far
+        self.frame = pd.DataFrame()
+        self.lock = threading.Lock()
+
+    def _last_seen(self, daily_skill):
+        keys = list(zip(daily_skill['PERIOD'], daily_skill['SKILL']))
+        return pd.Series([self.last_date.get(k, pd.NaT) for k in keys], index=daily_skill.index, dtype='datetime64[ns]')
+
+    # True when daily_skill only adds days after each series' last one (the days already
+    # ingested are unchanged), so ingest can push just the new days
+    def extends(self, daily_skill):
+        with self.lock:
+            if self.daily is None:
+                return True
+            known = daily_skill[daily_skill['DATE'] <= self._last_seen(daily_skill)]
+            return _in_order(known).equals(self.daily)
+
+    # Every series is pushed one row per calendar day up to its period's last date. Days
+    # without a row still move its windows on (as zero num/den days), so the windows summed
+    # across skills always equal the rolling totals of the combined line.
+    def ingest(self, daily_skill):
+        with self.lock:
+            ends = daily_skill.groupby('PERIOD')['DATE'].max()
+            cols = list(dict.fromkeys(col for num_col, den_col, _ in self.metrics.values() for col in (num_col, den_col)))
+            records = []
+            for key, rows in daily_skill.groupby(['PERIOD', 'SKILL'], sort=False):
+                last = self.last_date.get(key)
+                if last is None:
+                    days = pd.date_range(rows['DATE'].min(), ends[key[0]])
+                else:
+                    days = pd.date_range(last + pd.Timedelta(days=1), ends[key[0]])
+                if days.empty:
+                    continue
+                sums = rows.set_index('DATE')[cols].reindex(days, fill_value=0)
+                for metric, (num_col, den_col, scale) in self.metrics.items():
+                    trend = self.series.setdefault(key + (metric,), SkillTrend(scale))
+                    for date, num, den in zip(days, sums[num_col], sums[den_col]):
+                        record = trend.push(date, num, den)
+                        record.update(PERIOD=key[0], SKILL=key[1], DATE=date, METRIC=metric)
+                        records.append(record)
+                self.last_date[key] = days[-1]
+            self.daily = _in_order(daily_skill)
+
+            if records:
+                self.frame = pd.concat([self.frame, pd.DataFrame(records)], ignore_index=True)
+            return self.frame
+
+
+def _in_order(daily_skill):
+    return daily_skill.sort_values(['PERIOD', 'SKILL', 'DATE'], ignore_index=True)
+
+
+# --- Aggregate per-skill streaming state into per-period rolling lines and anomaly days
+def summarize_trend(store, metric, skills, periods, date_range):
+    trends = store.frame
+    if trends.empty:
+        return pd.DataFrame(), pd.DataFrame()
+    scale = store.metrics[metric][2]
+    sel = trends[
+        (trends['METRIC'] == metric) &
+        trends['SKILL'].isin(skills) &
+        trends['PERIOD'].isin(periods) &
+        trends['DATE'].between(pd.to_datetime(date_range[0]), pd.to_datetime(date_range[1]))
+    ]
+    sum_cols = ['NUM', 'DEN'] + [f'R{d}_{part}' for d in TREND_WINDOWS for part in ('NUM', 'DEN')]
+    agg = sel.groupby(['PERIOD', 'DATE'])[sum_cols].sum().reset_index()
+    agg['VALUE'] = agg['NUM'] / agg['DEN'].replace(0, np.nan) * scale
+    for d in TREND_WINDOWS:
+        agg[f'ROLL_{d}'] = agg[f'R{d}_NUM'] / agg[f'R{d}_DEN'].replace(0, np.nan) * scale
+
+    flagged = sel[sel['ANOMALY']]
+    anomalies = flagged.groupby(['PERIOD', 'DATE'])['SKILL'].agg(', '.join).reset_index()
+    anomalies = anomalies.merge(agg[['PERIOD', 'DATE', 'VALUE']], on=['PERIOD', 'DATE'], how='left')
+    return agg, anomalies
+
+
+# --- Rolling-average lines and anomaly markers to lay over a daily trend chart, as Plotly traces
+def trend_overlays(store, metric, skills, periods, date_range, grain='D'):
+    agg, anomalies = summarize_trend(store, metric, skills, periods, date_range)
+    if agg.empty:
+        return []
+    if grain != 'D':
+        # Match the chart's level of detail: one averaged rolling point per week/month, and
+        # each anomaly moved to its bucket, on the bucket's all-hours value
+        roll_cols = [f'ROLL_{d}' for d in TREND_WINDOWS]
+        buckets = agg.groupby(['PERIOD', bucket_dates(agg['DATE'], grain)])
+        sums = buckets[['NUM', 'DEN']].sum()
+        agg = buckets[roll_cols].mean().assign(
+            VALUE=sums['NUM'] / sums['DEN'].replace(0, np.nan) * store.metrics[metric][2]
+        ).reset_index()
+        if not anomalies.empty:
+            anomalies = (
+                anomalies.assign(
+                    SKILL=anomalies['DATE'].dt.strftime('%Y-%m-%d ') + anomalies['SKILL'],
+                    DATE=bucket_dates(anomalies['DATE'], grain),
+                )
+                .groupby(['PERIOD', 'DATE'])['SKILL'].agg('; '.join).reset_index()
+                .merge(agg[['PERIOD', 'DATE', 'VALUE']], on=['PERIOD', 'DATE'], how='left')
+            )
+    dashes = {TREND_WINDOWS[0]: 'dot', TREND_WINDOWS[1]: 'dash'}
+    traces = []
+    for period, part in agg.groupby('PERIOD'):
+        for d in TREND_WINDOWS:
+            traces.append(go.Scattergl(
+                x=part['DATE'], y=part[f'ROLL_{d}'], mode='lines',
+                name=f"{period} - {d}d avg", line=dict(dash=dashes[d], width=2),
+            ))
+    if not anomalies.empty:
+        traces.append(go.Scattergl(
+            x=anomalies['DATE'], y=anomalies['VALUE'], mode='markers',
+            name="Anomaly (per skill)", marker=dict(symbol='x', size=11, color='#dc2626'),
+            text=anomalies['PERIOD'] + ': ' + anomalies['SKILL'],
+            hovertemplate="%{x|%Y-%m-%d}<br>%{text}<extra>Anomaly</extra>",
+        ))
+    return traces
@@ -1,8 +1,6 @@
 import streamlit as st
 
-from chat_viz import run_chat_dashboard
-from voice_viz import run_voice_dashboard
-from voice_sales_viz import run_voice_sales_dashboard
+from sla_dashboard import run_dashboard
 
 st.set_page_config(page_title="Unified SLA Dashboards", layout="wide")
 
@@ -14,10 +12,10 @@ dashboard = st.sidebar.radio("Select a dashboard", [
 ])
 
 if dashboard == "💬 Chat SLA Dashboard":
-    run_chat_dashboard()
+    run_dashboard('chat')
 
 elif dashboard == "📞 Voice SLA (Pod Skills)":
-    run_voice_dashboard()
+    run_dashboard('voice')
 
 elif dashboard == "📈 Voice SLA (Sales)":
-    run_voice_sales_dashboard()
+    run_dashboard('voice_sales')